@@ -1,23 +1,40 @@
 import os
+import sys
+import asyncio
 import base64
+import atexit
+import queue
 import logging
-from typing import Optional, Dict, List
+import logging.handlers
+from functools import lru_cache
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Dict, List, Set
 from urllib.parse import quote
 from dotenv import load_dotenv
-import requests
+import aiohttp
+import orjson
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from cachetools import TTLCache
 from fastmcp import FastMCP
 
 # -----------------------------------
 # Setup Logging
 # -----------------------------------
+# Records are formatted on the calling thread and written to the console and
+# log file by a background listener, so handlers never block on disk I/O
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),  # Output to console
+    logging.FileHandler('azure_devops_mcp.log'),  # Output to file
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),  # Output to console
-        logging.FileHandler('azure_devops_mcp.log')  # Output to file
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # -----------------------------------
@@ -26,293 +43,530 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 ORGANIZATION = os.getenv("ORGANIZATION")
 PROJECT = os.getenv("PROJECT")
-BASE_URL = os.getenv("BASE_URL", "https://dev.azure.com")
+BASE_URL = os.getenv("BASE_URL", "https://dev.azure.com").rstrip("/")
 API_VERSION = "7.2-preview"
-PAT = os.getenv("AZURE_DEVOPS_PAT")
+PAT = (os.getenv("AZURE_DEVOPS_PAT") or "").strip()
 
-if not all([ORGANIZATION, PROJECT, PAT]):
-    logger.error("Missing required environment variables: ORGANIZATION, PROJECT, or AZURE_DEVOPS_PAT")
+_missing = [name for name, value in (("ORGANIZATION", ORGANIZATION), ("PROJECT", PROJECT), ("AZURE_DEVOPS_PAT", PAT)) if not value]
+if _missing:
+    logger.error("Missing required environment variables: %s", ", ".join(_missing))
     raise ValueError("Required environment variables are not set")
 
+# Azure DevOps issues 52-character (legacy) or 84-character PATs
+if len(PAT) not in (52, 84):
+    logger.warning("AZURE_DEVOPS_PAT has unexpected length %s; requests may fail with 401", len(PAT))
+
 AZURE_DEVOPS_URL = f"{BASE_URL}/{ORGANIZATION}/{PROJECT}/_apis"
 HEADERS = {
-    "Authorization": f"Basic {base64.b64encode(f':{PAT}'.encode()).decode()}",
+    "Authorization": "Basic " + base64.b64encode(b":" + PAT.encode()).decode(),
     "Content-Type": "application/json-patch+json",
 }
 
+# Request URLs and bodies that never change, built once at import time
+_WIQL_URL = AZURE_DEVOPS_URL + "/wit/wiql?$top=10&api-version=" + API_VERSION
+_BATCH_URL = AZURE_DEVOPS_URL + "/wit/workitemsbatch?api-version=" + API_VERSION
+# Per-call URLs are built by concatenation, not %-formatting, because ORGANIZATION
+# and PROJECT may themselves contain percent-encoded characters (e.g. My%20Project)
+_API_VERSION_QS = "?api-version=" + API_VERSION
+_WORKITEMS_PREFIX = AZURE_DEVOPS_URL + "/wit/workitems/"
+_WI_LIST_PREFIX = AZURE_DEVOPS_URL + "/wit/workitems?ids="
+_WI_LIST_SUFFIX = "&api-version=" + API_VERSION
+_WIT_BATCH_URL = f"{BASE_URL}/{ORGANIZATION}/_apis/wit/$batch?api-version={API_VERSION}"
+_WIT_BATCH_URI_PREFIX = "/_apis/wit/workitems/"
+_WIQL_RECENT_BODY = {
+    "query": "SELECT [System.Id], [System.Title], [System.State] FROM workitems WHERE [System.TeamProject] = @project ORDER BY [System.ChangedDate] DESC"
+}
+_BATCH_FIELDS = ["System.Id", "System.Title", "System.State"]
+_SUMMARY_LINE = "ID: {} | Title: {} | State: {}".format
+
+# JSON-Patch operation templates; copied and filled per call
+_TITLE_OP = {"op": "add", "path": "/fields/System.Title", "value": None}
+_DESCRIPTION_OP = {"op": "add", "path": "/fields/System.Description", "value": None}
+_STORY_POINTS_OP = {"op": "add", "path": "/fields/Microsoft.VSTS.Scheduling.StoryPoints", "value": None}
+_STATE_OP = {"op": "add", "path": "/fields/System.State", "value": None}
+_PARENT_OP = {"op": "add", "path": "/relations/-", "value": None}
+# Ordered to match update_work_item's (title, description, story_points, state) arguments
+_UPDATE_OPS = (_TITLE_OP, _DESCRIPTION_OP, _STORY_POINTS_OP, _STATE_OP)
+
+# Work item types are a small closed set, so their encodings are memoized
+_quote_type = lru_cache(maxsize=32)(quote)
+
+# -----------------------------------
+# HTTP Session
+# -----------------------------------
+_session: Optional[aiohttp.ClientSession] = None
+
+def _json_dumps(obj) -> str:
+    """Serialize request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Open a shared, keep-alive HTTP session and the update batcher for the lifetime of the server."""
+    global _session, _update_queue
+    _session = aiohttp.ClientSession(
+        headers=HEADERS,
+        json_serialize=_json_dumps,
+        timeout=aiohttp.ClientTimeout(total=10),
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+    )
+    logger.info("HTTP session opened")
+    _update_queue = asyncio.Queue()
+    flusher = asyncio.create_task(_flush_updates())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        for task in _update_tasks:
+            task.cancel()
+        await asyncio.gather(flusher, *_update_tasks, return_exceptions=True)
+        _update_queue = None
+        await _session.close()
+        _session = None
+        logger.info("HTTP session closed")
+
+# -----------------------------------
+# Work Item Cache
+# -----------------------------------
+# Full work item payloads keyed by ID, shared by every read path
+_wi_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+# Outstanding single-item fetches, so concurrent callers share one request
+_inflight: Dict[str, asyncio.Future] = {}
+# Bumped on every invalidation so fetches started earlier do not write stale data back.
+# A single counter keeps memory bounded; an unrelated invalidation only costs a cache miss.
+_wi_generation = 0
+
+# -----------------------------------
+# Update Batching
+# -----------------------------------
+# Updates arriving within this window are sent together through wit/$batch
+_UPDATE_BATCH_WINDOW = 0.1
+_UPDATE_BATCH_MAX = 20
+# Pending (work_item_id, patch_body, future) tuples, created in the lifespan hook
+_update_queue: Optional[asyncio.Queue] = None
+# Batches currently being sent; referenced here so they are not garbage collected
+_update_tasks: Set[asyncio.Task] = set()
+
 # -----------------------------------
 # MCP Server Initialization
 # -----------------------------------
-mcp = FastMCP("Azure DevOps Work Items Manager")
+mcp = FastMCP("Azure DevOps Work Items Manager", lifespan=_lifespan)
 
 # -----------------------------------
 # Helper Functions
 # -----------------------------------
-def _fetch_work_item_details(url: str) -> Dict:
-    """Helper to fetch work item details from a given URL."""
+# Throttling and gateway errors are retried; anything else (400, 401, 404, ...) fails fast
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# A gateway timeout may arrive after the server already applied a non-idempotent
+# request, so those only retry when the server says it did not process it
+_NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRY_AFTER = 30.0
+
+class _RetryableResponseError(aiohttp.ClientResponseError):
+    """An HTTP error response that is safe to retry for the request that got it."""
+
+def _is_retryable(exc: BaseException) -> bool:
+    return isinstance(exc, _RetryableResponseError)
+
+_backoff = wait_exponential_jitter(initial=1, max=10)
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After delay if it sent one, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    retry_after = exc.headers.get("Retry-After") if exc is not None and exc.headers else None
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return _backoff(retry_state)
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _request(method: str, url: str, retry_statuses: frozenset = _RETRY_STATUSES, **kwargs) -> Dict:
+    """Send a request on the shared session and return the decoded JSON body."""
+    async with _session.request(method, url, **kwargs) as response:
+        if response.status >= 400:
+            error = _RetryableResponseError if response.status in retry_statuses else aiohttp.ClientResponseError
+            raise error(
+                response.request_info,
+                response.history,
+                status=response.status,
+                message=await response.text(),
+                headers=response.headers,
+            )
+        body = await response.read()
+    return orjson.loads(body) if body else {}
+
+async def _get(url: str, **kwargs) -> Dict:
+    return await _request("GET", url, **kwargs)
+
+async def _post(url: str, **kwargs) -> Dict:
+    return await _request("POST", url, **kwargs)
+
+async def _patch(url: str, **kwargs) -> Dict:
+    return await _request("PATCH", url, **kwargs)
+
+async def _delete(url: str, **kwargs) -> Dict:
+    return await _request("DELETE", url, **kwargs)
+
+def _invalidate_work_item(work_item_id: str) -> None:
+    """Drop a work item from the cache after it was changed or deleted."""
+    global _wi_generation
+    _wi_cache.pop(work_item_id, None)
+    _inflight.pop(work_item_id, None)
+    _wi_generation += 1
+
+async def _request_work_item(work_item_id: str) -> Dict:
+    """Fetch a single work item from Azure DevOps and cache it."""
+    generation = _wi_generation
+    url = _WORKITEMS_PREFIX + work_item_id + _API_VERSION_QS
+    data = await _get(url)
+    if _wi_generation == generation:
+        _wi_cache[work_item_id] = data
+    return data
+
+async def _fetch_work_item(work_item_id: str) -> Dict:
+    """Get a work item from the cache, joining an in-flight fetch if there is one."""
+    data = _wi_cache.get(work_item_id)
+    if data is not None:
+        return data
+    
+    future = _inflight.get(work_item_id)
+    if future is None:
+        future = asyncio.ensure_future(_request_work_item(work_item_id))
+        _inflight[work_item_id] = future
+        
+        def _discard(done: asyncio.Future) -> None:
+            # An invalidation may already have replaced or removed this entry
+            if _inflight.get(work_item_id) is done:
+                del _inflight[work_item_id]
+        
+        future.add_done_callback(_discard)
+    # Shield so one caller being cancelled does not cancel the shared fetch
+    return await asyncio.shield(future)
+
+def _format_summaries(items: List[Dict]) -> str:
+    """Format work items as one 'ID | Title | State' line each."""
+    return "\n".join(
+        _SUMMARY_LINE(item["id"], item["fields"]["System.Title"], item["fields"]["System.State"])
+        for item in items
+    )
+
+async def _fetch_fields(work_item_id: str) -> Dict:
+    """Get the fields shown by the single work item resource and prompts."""
+    data = await _fetch_work_item(work_item_id)
+    fields = data["fields"]
+    return {
+        "id": data["id"],
+        "title": fields["System.Title"],
+        "state": fields["System.State"],
+        "description": fields.get("System.Description", "No description"),
+        "url": data["url"],
+    }
+
+async def _patch_work_item(work_item_id: str, body: List[Dict]) -> Dict:
+    """Apply a JSON-Patch body to a single work item."""
+    return await _patch(_WORKITEMS_PREFIX + work_item_id + _API_VERSION_QS, json=body)
+
+async def _send_updates(pending: List[tuple]) -> None:
+    """Send queued updates, as one wit/$batch request when there is more than one."""
     try:
-        logger.debug(f"Fetching work item details from {url}")
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        return response.json()
+        if len(pending) == 1:
+            work_item_id, body, future = pending[0]
+            results = [{"code": 200, "body": await _patch_work_item(work_item_id, body)}]
+        else:
+            batch = [
+                {
+                    "method": "PATCH",
+                    "uri": _WIT_BATCH_URI_PREFIX + work_item_id + _API_VERSION_QS,
+                    "headers": {"Content-Type": "application/json-patch+json"},
+                    "body": body,
+                }
+                for work_item_id, body, _ in pending
+            ]
+            data = await _post(_WIT_BATCH_URL, json=batch, headers={"Content-Type": "application/json"})
+            results = data["value"]
+            logger.info("Sent %s work item updates in one batch", len(pending))
+        
+        for (_, _, future), result in zip(pending, results):
+            if future.done():
+                continue
+            # A malformed sub-response only fails its own caller
+            try:
+                if result["code"] >= 400:
+                    raise RuntimeError(f"HTTP Error {result['code']}: {result['body']}")
+                body = result["body"]
+                future.set_result(orjson.loads(body) if isinstance(body, str) else body)
+            except Exception as e:
+                future.set_exception(e)
     except Exception as e:
-        logger.error(f"Failed to fetch work item details from {url}: {e}")
-        raise
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        # Covers a short results list and cancellation, so no caller waits forever
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("No result returned for work item update"))
+
+def _on_updates_sent(task: asyncio.Task) -> None:
+    _update_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to send queued work item updates: %s", task.exception())
+
+async def _flush_updates() -> None:
+    """Collect queued updates for a short window and send them together."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            pending = [await _update_queue.get()]
+            deadline = loop.time() + _UPDATE_BATCH_WINDOW
+            while len(pending) < _UPDATE_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(_update_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Send in the background so a slow batch does not hold up the next window
+            task = asyncio.create_task(_send_updates(pending))
+            _update_tasks.add(task)
+            task.add_done_callback(_on_updates_sent)
+        except Exception as e:
+            logger.error("Failed to collect queued work item updates: %s", e)
 
 # -----------------------------------
 # Resources
 # -----------------------------------
 @mcp.resource("workitems://recent")
-def get_recent_work_items() -> str:
+async def get_recent_work_items() -> str:
     """Get a list of recent work items using WIQL."""
     logger.info("Fetching recent work items")
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/wiql?api-version={API_VERSION}"
-        query = {
-            "query": "SELECT [System.Id], [System.Title], [System.State] FROM workitems WHERE [System.TeamProject] = @project ORDER BY [System.ChangedDate] DESC"
-        }
-        response = requests.post(url, json=query, headers=HEADERS)
-        response.raise_for_status()
-        
-        work_items = response.json().get("workItems", [])
+        work_items = (await _post(_WIQL_URL, json=_WIQL_RECENT_BODY)).get("workItems", [])
         if not work_items:
             logger.info("No recent work items found")
             return "No recent work items found"
         
-        details: List[str] = []
-        for item in work_items[:10]:
-            item_data = _fetch_work_item_details(item["url"])
-            title = item_data["fields"]["System.Title"]
-            state = item_data["fields"]["System.State"]
-            details.append(f"ID: {item['id']} | Title: {title} | State: {state}")
+        body = {"ids": [item["id"] for item in work_items[:10]], "fields": _BATCH_FIELDS}
+        data = await _post(_BATCH_URL, json=body)
         
-        result = "\n".join(details)
-        logger.info(f"Successfully fetched {len(details)} recent work items")
+        items = data["value"]
+        result = _format_summaries(items)
+        logger.info("Successfully fetched %s recent work items", len(items))
         return result
     except Exception as e:
-        logger.error(f"Failed to fetch recent work items: {e}")
+        logger.error("Failed to fetch recent work items: %s", e)
         return f"Error: {str(e)}"
 
 @mcp.resource("workitems://{work_item_id}")
-def get_work_item(work_item_id: str) -> str:
+async def get_work_item(work_item_id: str) -> str:
     """Retrieve a single work item by ID."""
-    logger.info(f"Fetching work item {work_item_id}")
+    logger.info("Fetching work item %s", work_item_id)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems/{work_item_id}?api-version={API_VERSION}"
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
+        item = await _fetch_fields(work_item_id)
         
         result = (
-            f"ID: {data['id']}\n"
-            f"Title: {data['fields']['System.Title']}\n"
-            f"State: {data['fields']['System.State']}\n"
-            f"Description: {data['fields'].get('System.Description', 'No description')}\n"
-            f"URL: {data['url']}"
+            f"ID: {item['id']}\n"
+            f"Title: {item['title']}\n"
+            f"State: {item['state']}\n"
+            f"Description: {item['description']}\n"
+            f"URL: {item['url']}"
         )
-        logger.info(f"Successfully fetched work item {work_item_id}")
+        logger.info("Successfully fetched work item %s", work_item_id)
         return result
     except Exception as e:
-        logger.error(f"Failed to fetch work item {work_item_id}: {e}")
+        logger.error("Failed to fetch work item %s: %s", work_item_id, e)
         return f"Error: {str(e)}"
 
 @mcp.resource("workitems://list/{ids}")
-def list_work_items(ids: str) -> str:
+async def list_work_items(ids: str) -> str:
     """List work items by comma-separated IDs."""
-    logger.info(f"Listing work items for IDs: {ids}")
+    logger.info("Listing work items for IDs: %s", ids)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems?ids={ids}&api-version={API_VERSION}"
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
+        # Normalize so "05" and the response's 5 share a cache key
+        id_list = [str(int(id)) for id in ids.split(",")]
+        # Snapshot hits up front; entries may be evicted or invalidated while the fetch is awaited
+        cached = {id: _wi_cache.get(id) for id in id_list}
+        fetched: Dict[str, Dict] = {}
+        misses = [id for id, item in cached.items() if item is None]
+        if misses:
+            generation = _wi_generation
+            data = await _get(_WI_LIST_PREFIX + ",".join(misses) + _WI_LIST_SUFFIX)
+            fetched = {str(item["id"]): item for item in data["value"]}
+            if _wi_generation == generation:
+                _wi_cache.update(fetched)
         
-        if not data["value"]:
+        items = [item for id in id_list if (item := cached[id] or fetched.get(id))]
+        if not items:
             logger.info("No work items found for provided IDs")
             return "No work items found"
         
-        details: List[str] = []
-        for item in data["value"]:
-            title = item["fields"]["System.Title"]
-            state = item["fields"]["System.State"]
-            details.append(f"ID: {item['id']} | Title: {title} | State: {state}")
-        
-        result = "\n".join(details)
-        logger.info(f"Successfully listed {len(details)} work items")
+        result = _format_summaries(items)
+        logger.info("Successfully listed %s work items", len(items))
         return result
     except Exception as e:
-        logger.error(f"Failed to list work items: {e}")
+        logger.error("Failed to list work items: %s", e)
         return f"Error: {str(e)}"
 
 @mcp.resource("workitems://batch/{ids}")
-def get_work_items_batch(ids: str) -> str:
+async def get_work_items_batch(ids: str) -> str:
     """Get multiple work items in a batch by comma-separated IDs."""
-    logger.info(f"Fetching batch work items for IDs: {ids}")
+    logger.info("Fetching batch work items for IDs: %s", ids)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitemsbatch?api-version={API_VERSION}"
-        body = {
-            "ids": [int(id.strip()) for id in ids.split(",")],
-            "fields": ["System.Id", "System.Title", "System.State"]
-        }
-        response = requests.post(url, json=body, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
+        # int() ignores surrounding whitespace itself, so no per-ID strip() is needed
+        id_list = list(map(int, ids.split(",")))
+        # Batch responses only carry a subset of fields, so they are read from
+        # the cache but never written back to it
+        cached = {id: _wi_cache.get(str(id)) for id in id_list}
+        fetched: Dict[int, Dict] = {}
+        misses = [id for id, item in cached.items() if item is None]
+        if misses:
+            body = {"ids": misses, "fields": _BATCH_FIELDS}
+            data = await _post(_BATCH_URL, json=body)
+            fetched = {item["id"]: item for item in data["value"]}
         
-        if not data["value"]:
+        items = [item for id in id_list if (item := cached[id] or fetched.get(id))]
+        if not items:
             logger.info("No work items found in batch")
             return "No work items found"
         
-        details: List[str] = []
-        for item in data["value"]:
-            title = item["fields"]["System.Title"]
-            state = item["fields"]["System.State"]
-            details.append(f"ID: {item['id']} | Title: {title} | State: {state}")
-        
-        result = "\n".join(details)
-        logger.info(f"Successfully fetched {len(details)} batch work items")
+        result = _format_summaries(items)
+        logger.info("Successfully fetched %s batch work items", len(items))
         return result
     except Exception as e:
-        logger.error(f"Failed to fetch batch work items: {e}")
+        logger.error("Failed to fetch batch work items: %s", e)
         return f"Error: {str(e)}"
 
 # -----------------------------------
 # Tools
 # -----------------------------------
 @mcp.tool()
-def create_work_item(type: str, title: str, description: str = "", parent_id: Optional[str] = None, story_points: Optional[float] = None) -> Dict:
+async def create_work_item(type: str, title: str, description: str = "", parent_id: Optional[str] = None, story_points: Optional[float] = None) -> Dict:
     """Create a new work item (e.g., User Story, Task)."""
-    logger.info(f"Creating work item: Type={type}, Title={title}")
+    logger.info("Creating work item: Type=%s, Title=%s", type, title)
     try:
-        encoded_type = quote(type)
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems/${encoded_type}?api-version={API_VERSION}"
-        body = [
-            {"op": "add", "path": "/fields/System.Title", "value": title},
-            {"op": "add", "path": "/fields/System.Description", "value": description or ""},
-        ]
+        url = _WORKITEMS_PREFIX + "$" + _quote_type(type) + _API_VERSION_QS
+        body = [{**_TITLE_OP, "value": title}, {**_DESCRIPTION_OP, "value": description or ""}]
         
-        if story_points and type.lower() == "user story":
-            body.append({"op": "add", "path": "/fields/Microsoft.VSTS.Scheduling.StoryPoints", "value": story_points})
+        if story_points is not None and type.lower() == "user story":
+            body.append({**_STORY_POINTS_OP, "value": story_points})
         
         if parent_id:
             body.append({
-                "op": "add",
-                "path": "/relations/-",
+                **_PARENT_OP,
                 "value": {
                     "rel": "System.LinkTypes.Hierarchy-Reverse",
-                    "url": f"{AZURE_DEVOPS_URL}/wit/workitems/{parent_id}"
+                    "url": _WORKITEMS_PREFIX + parent_id
                 }
             })
         
-        response = requests.post(url, json=body, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
+        # Send pre-serialized bytes; the session already sets the JSON-Patch content type
+        data = await _post(url, data=orjson.dumps(body), retry_statuses=_NON_IDEMPOTENT_RETRY_STATUSES)
         
         result = {"result": f"Work item created: ID {data['id']}", "id": data["id"], "url": data["url"]}
-        logger.info(f"Work item created successfully: ID={data['id']}")
+        logger.info("Work item created successfully: ID=%s", data["id"])
         return result
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"Create work item failed with HTTP error: {e.response.text}")
-        return {"error": f"HTTP Error {e.response.status_code}: {e.response.text}"}
+    except aiohttp.ClientResponseError as e:
+        logger.error("Create work item failed with HTTP error: %s", e.message)
+        return {"error": f"HTTP Error {e.status}: {e.message}"}
     except Exception as e:
-        logger.error(f"Create work item failed: {e}")
+        logger.error("Create work item failed: %s", e)
         return {"error": str(e)}
 
 @mcp.tool()
-def delete_work_item(work_item_id: str) -> Dict:
+async def delete_work_item(work_item_id: str) -> Dict:
     """Delete a work item by ID."""
-    logger.info(f"Deleting work item {work_item_id}")
+    logger.info("Deleting work item %s", work_item_id)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems/{work_item_id}?api-version={API_VERSION}"
-        response = requests.delete(url, headers=HEADERS)
-        response.raise_for_status()
+        url = _WORKITEMS_PREFIX + work_item_id + _API_VERSION_QS
+        await _delete(url, retry_statuses=_NON_IDEMPOTENT_RETRY_STATUSES)
         
         result = {"result": f"Work item {work_item_id} deleted successfully"}
-        logger.info(f"Work item {work_item_id} deleted successfully")
+        logger.info("Work item %s deleted successfully", work_item_id)
         return result
     except Exception as e:
-        logger.error(f"Delete work item {work_item_id} failed: {e}")
+        logger.error("Delete work item %s failed: %s", work_item_id, e)
         return {"error": str(e)}
+    finally:
+        # A failed call (e.g. a gateway timeout) may still have deleted the item
+        _invalidate_work_item(work_item_id)
 
 @mcp.tool()
-def update_work_item(work_item_id: str, title: Optional[str] = None, description: Optional[str] = None, 
+async def update_work_item(work_item_id: str, title: Optional[str] = None, description: Optional[str] = None, 
                      story_points: Optional[float] = None, state: Optional[str] = None) -> Dict:
     """Update a work item’s fields."""
-    logger.info(f"Updating work item {work_item_id}")
+    logger.info("Updating work item %s", work_item_id)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems/{work_item_id}?api-version={API_VERSION}"
-        body = []
-        
-        if title:
-            body.append({"op": "add", "path": "/fields/System.Title", "value": title})
-        if description:
-            body.append({"op": "add", "path": "/fields/System.Description", "value": description})
-        if story_points:
-            body.append({"op": "add", "path": "/fields/Microsoft.VSTS.Scheduling.StoryPoints", "value": story_points})
-        if state:
-            body.append({"op": "add", "path": "/fields/System.State", "value": state})
+        body = [
+            {**op, "value": value}
+            for op, value in zip(_UPDATE_OPS, (title, description, story_points, state))
+            if value is not None
+        ]
         
         if not body:
-            logger.warning(f"No fields provided to update for work item {work_item_id}")
+            logger.warning("No fields provided to update for work item %s", work_item_id)
             return {"error": "No fields provided to update"}
         
-        response = requests.patch(url, json=body, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
+        future = asyncio.get_running_loop().create_future()
+        await _update_queue.put((work_item_id, body, future))
+        data = await future
+        _invalidate_work_item(work_item_id)
         
         result = {"result": f"Work item {work_item_id} updated", "url": data["url"]}
-        logger.info(f"Work item {work_item_id} updated successfully")
+        logger.info("Work item %s updated successfully", work_item_id)
         return result
     except Exception as e:
-        logger.error(f"Update work item {work_item_id} failed: {e}")
+        logger.error("Update work item %s failed: %s", work_item_id, e)
         return {"error": str(e)}
 
 # -----------------------------------
 # Prompts
 # -----------------------------------
 @mcp.prompt()
-def analyze_work_item(work_item_id: str) -> str:
+async def analyze_work_item(work_item_id: str) -> str:
     """Generate a prompt for analyzing a work item."""
-    logger.info(f"Generating analysis prompt for work item {work_item_id}")
+    logger.info("Generating analysis prompt for work item %s", work_item_id)
     try:
-        url = f"{AZURE_DEVOPS_URL}/wit/workitems/{work_item_id}?api-version={API_VERSION}"
-        response = requests.get(url, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
-        
-        title = data["fields"]["System.Title"]
-        state = data["fields"]["System.State"]
-        description = data["fields"].get("System.Description", "No description")
+        item = await _fetch_fields(work_item_id)
         
         result = (
             f"Please analyze this Azure DevOps work item:\n"
             f"ID: {work_item_id}\n"
-            f"Title: {title}\n"
-            f"State: {state}\n"
-            f"Description: {description}\n\n"
+            f"Title: {item['title']}\n"
+            f"State: {item['state']}\n"
+            f"Description: {item['description']}\n\n"
             f"What insights can you provide about its status and content?"
         )
-        logger.info(f"Analysis prompt generated for work item {work_item_id}")
+        logger.info("Analysis prompt generated for work item %s", work_item_id)
         return result
     except Exception as e:
-        logger.error(f"Failed to generate analysis prompt for work item {work_item_id}: {e}")
+        logger.error("Failed to generate analysis prompt for work item %s: %s", work_item_id, e)
         return f"Error retrieving work item: {str(e)}"
 
 @mcp.prompt()
 def suggest_work_item_update(work_item_id: str, title: Optional[str] = None, description: Optional[str] = None, 
                              story_points: Optional[float] = None, state: Optional[str] = None) -> str:
     """Generate a prompt to suggest updating a work item."""
-    logger.info(f"Generating update suggestion prompt for work item {work_item_id}")
+    logger.info("Generating update suggestion prompt for work item %s", work_item_id)
     updates = []
-    if title:
+    if title is not None:
         updates.append(f"Title: {title}")
-    if description:
+    if description is not None:
         updates.append(f"Description: {description}")
-    if story_points:
+    if story_points is not None:
         updates.append(f"Story Points: {story_points}")
-    if state:
+    if state is not None:
         updates.append(f"State: {state}")
     
     if not updates:
-        logger.info(f"No updates suggested for work item {work_item_id}")
+        logger.info("No updates suggested for work item %s", work_item_id)
         return "No updates suggested"
     
     updates_str = "\n".join(updates)
@@ -323,16 +577,23 @@ def suggest_work_item_update(work_item_id: str, title: Optional[str] = None, des
         f"{updates_str}\n\n"
         f"Proceed with these changes?"
     )
-    logger.info(f"Update suggestion prompt generated for work item {work_item_id}")
+    logger.info("Update suggestion prompt generated for work item %s", work_item_id)
     return result
 
 # -----------------------------------
 # Main Execution
 # -----------------------------------
 if __name__ == "__main__":
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
     logger.info("Starting Azure DevOps Work Items Manager MCP server")
     try:
         mcp.run(transport='stdio')
     except Exception as e:
-        logger.critical(f"MCP server failed to start: {e}")
+        logger.critical("MCP server failed to start: %s", e)
         raise
\ No newline at end of file